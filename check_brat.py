@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+
+# Check that bulk brat standoff formatting matches annotation objects.
+
+import sys
+
+from conllu import conllu
+
+def check_document(document):
+    """Return number of mismatching annotations in document."""
+    expected = [unicode(a) for a in document.to_brat_standoff()]
+    lines = document.to_brat_standoff_lines()
+    errors = 0
+    for e, l in zip(expected, lines):
+        if e != l:
+            print >> sys.stderr, 'Mismatch: "%s" vs. "%s"' % (
+                e.encode('utf-8'), l.encode('utf-8'))
+            errors += 1
+    if len(expected) != len(lines):
+        print >> sys.stderr, 'Mismatch: %d vs. %d annotations' % (
+            len(expected), len(lines))
+        errors += 1
+    return errors
+
+def main(argv):
+    errors = 0
+    for f in argv[1:]:
+        try:
+            for document in conllu.read_documents(f):
+                errors += check_document(document)
+        except conllu.FormatError, e:
+            print >> sys.stderr, 'Error processing %s: %s' % (f, str(e))
+            errors += 1
+    if errors:
+        print >> sys.stderr, '%d error(s)' % errors
+        return 1
+    print 'OK'
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -7,6 +7,9 @@ import re
 class Annotation(object):
     """Base class for annotations with ID and type."""
 
+    # Subclasses set id and type directly to avoid the super() call.
+    __slots__ = ('id', 'type')
+
     def __init__(self, id_, type_):
         self.id = id_
         self.type = type_
@@ -32,8 +35,11 @@ class Annotation(object):
 class Textbound(Annotation):
     """Textbound annotation representing entity mention or event trigger."""
 
+    __slots__ = ('spans', 'text')
+
     def __init__(self, id_, type_, spans, text):
-        super(Textbound, self).__init__(id_, type_)
+        self.id = id_
+        self.type = type_
         if isinstance(spans, basestring):
             self.spans = Textbound.parse_spans(spans)
         else:
@@ -67,29 +73,42 @@ class Textbound(Annotation):
 class Relation(Annotation):
     """Typed binary relation annotation."""
 
+    __slots__ = ('_args',)
+
     def __init__(self, id_, type_, args):
-        super(Relation, self).__init__(id_, type_)
+        self.id = id_
+        self.type = type_
         if isinstance(args, basestring):
-            self._args = args
+            self._args = Relation.parse_args(args)
         else:
-            self._args = ' '.join('%s:%s' % a for a in args)
-            
+            self._args = tuple(tuple(a) for a in args)
+
     def args(self):
-        a1, a2 = self._args.split(' ')
-        a1key, a1val = a1.split(':', 1)
-        a2key, a2val = a2.split(':', 1)
-        return ((a1key, a1val), (a2key, a2val))
+        return self._args
 
     def __unicode__(self):
-        return u'%s\t%s %s' % (self.id, self.type, self._args)
+        (a1key, a1val), (a2key, a2val) = self._args
+        return u'%s\t%s %s:%s %s:%s' % (self.id, self.type,
+                                       a1key, a1val, a2key, a2val)
     
     STANDOFF_RE = re.compile(r'^(\S+)\t(\S+) (\S+:\S+ \S+:\S+)$')
 
+    @staticmethod
+    def parse_args(args_string):
+        """Return ((key, value), (key, value)) for given args string."""
+        a1, a2 = args_string.split(' ')
+        a1key, a1val = a1.split(':', 1)
+        a2key, a2val = a2.split(':', 1)
+        return ((a1key, a1val), (a2key, a2val))
+
 class Event(Annotation):
     """Typed, textbound event annotation."""
 
+    __slots__ = ('trigger', 'args')
+
     def __init__(self, id_, type_, trigger, args):
-        super(Event, self).__init__(id_, type_)
+        self.id = id_
+        self.type = type_
         self.trigger = trigger
         self.args = args
 
@@ -101,8 +120,11 @@ class Event(Annotation):
 class Normalization(Annotation):
     """Reference relating annotation to external resource."""
 
+    __slots__ = ('arg', 'ref', 'text')
+
     def __init__(self, id_, type_, arg, ref, text):
-        super(Normalization, self).__init__(id_, type_)
+        self.id = id_
+        self.type = type_
         self.arg = arg
         self.ref = ref
         self.text = text
@@ -112,8 +134,11 @@ class Normalization(Annotation):
 class Attribute(Annotation):
     """Attribute with optional value associated with another annotation."""
 
+    __slots__ = ('arg', 'val')
+
     def __init__(self, id_, type_, arg, val):
-        super(Attribute, self).__init__(id_, type_)
+        self.id = id_
+        self.type = type_
         self.arg = arg
         self.val = val
 
@@ -128,8 +153,11 @@ class Attribute(Annotation):
 class Comment(Annotation):
     """Typed free-form text comment associated with another annotation."""
 
+    __slots__ = ('arg', 'text')
+
     def __init__(self, id_, type_, arg, text):
-        super(Comment, self).__init__(id_, type_)
+        self.id = id_
+        self.type = type_
         self.arg = arg
         self.text = text
 
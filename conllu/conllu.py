@@ -218,13 +218,64 @@ class Element(object):
             start, end = self.id.split('-')
             first, last = element_by_id[start], element_by_id[end]
             spans = [[first.offset, last.offset+len(last.form)]]
-            text  = ' '.join(str(element_by_id[str(t)].form)
+            text  = ' '.join(element_by_id[str(t)].form
                               for t in range(int(start), int(end)+1))
             return [
                 brat.Textbound('T'+bid, 'Multiword-token', spans, text),
                 brat.Comment('#'+bid, COMMENT_TYPE, 'T'+bid, 'FORM='+self.form)
             ]
 
+    def to_brat_standoff_lines(self, element_by_id):
+        """Return list of brat standoff lines for the element.
+
+        Gives the same output as formatting the annotations returned
+        by to_brat_standoff(), but without creating annotation objects.
+        Changes to either mapping must be made to both; check_brat.py
+        verifies that they agree."""
+        bid = '%s.%s' % (self.sentence.id, self.id)
+        if self.is_word():
+            # see to_brat_standoff() for the mapping.
+            start = self.offset
+            lines = [
+                u'T%s\t%s %d %d\t%s' % (bid, self.cpostag, start,
+                                         start+len(self.form), self.form)
+            ]
+            # attributes
+            for i, (name, value) in enumerate(self.feats()):
+                if not value:
+                    lines.append(u'A%s-%d\t%s T%s' % (bid, i+1, name, bid))
+                else:
+                    lines.append(u'A%s-%d\t%s T%s %s' % (bid, i+1, name, bid,
+                                                          value))
+            # relations
+            rnum = 0
+            for head, deprel in self.deps(include_primary=True):
+                if head == '0':
+                    continue # skip root
+                rnum += 1
+                lines.append(u'R%s-%d\t%s Arg1:T%s.%s Arg2:T%s' % (
+                    bid, rnum, deprel, self.sentence.id,
+                    element_by_id[head].id, bid))
+            # comment
+            if self.misc != '_':
+                lines.append(u'#%s\t%s T%s\tLEMMA=%s POSTAG=%s MISC=%s' % (
+                    bid, COMMENT_TYPE, bid, self.lemma, self.postag,
+                    self.misc))
+            else:
+                lines.append(u'#%s\t%s T%s\tLEMMA=%s POSTAG=%s' % (
+                    bid, COMMENT_TYPE, bid, self.lemma, self.postag))
+            return lines
+        else:
+            start, end = self.id.split('-')
+            first, last = element_by_id[start], element_by_id[end]
+            text  = ' '.join(element_by_id[str(t)].form
+                              for t in range(int(start), int(end)+1))
+            return [
+                u'T%s\tMultiword-token %d %d\t%s' % (
+                    bid, first.offset, last.offset+len(last.form), text),
+                u'#%s\t%s T%s\tFORM=%s' % (bid, COMMENT_TYPE, bid, self.form)
+            ]
+
     def __unicode__(self):
         fields = [self.id, self.form, self.lemma, self.cpostag, self.postag, 
                   self._feats, self.head, self.deprel, self._deps, self.misc]
@@ -364,6 +415,14 @@ class Sentence(object):
             annotations.extend(element.to_brat_standoff(self.element_by_id()))
         return annotations
 
+    def to_brat_standoff_lines(self):
+        """Return list of brat standoff lines for the sentence."""
+        element_by_id = self.element_by_id()
+        lines = []
+        for element in self._elements:
+            lines.extend(element.to_brat_standoff_lines(element_by_id))
+        return lines
+
     def __unicode__(self):
         element_unicode = [unicode(e) for e in self._elements]
         return '\n'.join(self.comments + element_unicode)+'\n'
@@ -400,6 +459,13 @@ class Document(object):
             annotations.extend(sentence.to_brat_standoff())
         return annotations
 
+    def to_brat_standoff_lines(self):
+        """Return list of brat standoff lines for the document."""
+        lines = []
+        for sentence in self._sentences:
+            lines.extend(sentence.to_brat_standoff_lines())
+        return lines
+
 def _file_name(file_like, default='document'):
     """Return name of named file or file-like object, or default if not
     available."""
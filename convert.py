@@ -20,8 +20,8 @@ def output_document_text(document, output, options=None):
     print >> output, document.text()
 
 def output_document_annotations(document, output, options=None):
-    for annotation in document.to_brat_standoff():
-        print >> output, unicode(annotation)
+    for line in document.to_brat_standoff_lines():
+        print >> output, line
     
 def output_document(document, options=None):
     """Output given document according to given options."""
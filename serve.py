@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+
+# Serve CoNLL-U sentences and documents over localhost HTTP.
+
+import os
+import sys
+import urlparse
+import BaseHTTPServer
+
+from collections import OrderedDict
+
+from conllu import conllu
+
+# Supported output formats
+FORMATS = ('conllu', 'text', 'brat')
+
+DEFAULT_FORMAT = 'conllu'
+
+def _cache_size(value):
+    import argparse
+    size = int(value)
+    if size < 0:
+        raise argparse.ArgumentTypeError('must be at least 0: %s' % value)
+    return size
+
+def argparser():
+    import argparse
+    parser = argparse.ArgumentParser(description="Serve CoNLL-U data.")
+    parser.add_argument('-H', '--host', default='127.0.0.1',
+                        help='Address to listen on (default 127.0.0.1).')
+    parser.add_argument('-p', '--port', type=int, default=8090,
+                        help='Port to listen on (default 8090).')
+    parser.add_argument('-c', '--cache-size', metavar='N', type=_cache_size,
+                        default=10000,
+                        help='Maximum number of cached items.')
+    parser.add_argument('file', nargs='+', help='Source file(s).')
+    return parser
+
+class LRUCache(object):
+    """Mapping with a size limit, discarding least recently used items."""
+
+    def __init__(self, max_size):
+        self.max_size = max(0, max_size)
+        self._items = OrderedDict()
+
+    def get(self, key, default=None):
+        try:
+            value = self._items.pop(key)
+        except KeyError:
+            return default
+        self._items[key] = value
+        return value
+
+    def put(self, key, value):
+        self._items.pop(key, None)
+        self._items[key] = value
+        while self._items and len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def invalidate(self, prefix):
+        """Remove items with keys whose first value is prefix."""
+        for key in [k for k in self._items if k[0] == prefix]:
+            del self._items[key]
+
+    def __len__(self):
+        return len(self._items)
+
+class _PositionedLines(object):
+    """Iterate over decoded lines of binary file, tracking byte position."""
+
+    def __init__(self, f, encoding='utf-8'):
+        self.f = f
+        self.encoding = encoding
+        self.position = 0
+
+    def __iter__(self):
+        for line in self.f:
+            self.position += len(line)
+            yield line.decode(self.encoding)
+
+def _stamp(st):
+    """Return value identifying file version for given stat result."""
+    return (st.st_mtime, st.st_size)
+
+class CorpusError(Exception):
+    """Corpus file could not be read or indexed."""
+    pass
+
+class NotFoundError(Exception):
+    """No sentence or document with the requested id."""
+    pass
+
+class Corpus(object):
+    """CoNLL-U file with sentences parsed on demand and cached.
+
+    The file is read once to index sentence positions and reindexed
+    when its modification time or size changes, invalidating any
+    cached items for the file. If reindexing fails, the last good
+    index and cached items are kept."""
+
+    def __init__(self, filename, cache):
+        self.filename = filename
+        self.cache = cache
+        self._stamp = None
+        self._index = None
+        self.refresh()
+
+    def refresh(self):
+        """Reindex the file if it has changed since last indexed.
+
+        Raises CorpusError if the file cannot be read or parsed."""
+        try:
+            if _stamp(os.stat(self.filename)) == self._stamp:
+                return
+            with open(self.filename, 'rb') as f:
+                stamp = _stamp(os.fstat(f.fileno()))
+                index = self._build_index(f)
+                if _stamp(os.fstat(f.fileno())) != stamp:
+                    raise CorpusError('changed while indexing')
+        except (IOError, OSError, UnicodeDecodeError, AssertionError,
+                conllu.FormatError, CorpusError), e:
+            raise CorpusError('%s: %s' % (self.filename, e))
+        self._index = index
+        self._stamp = stamp
+        self.cache.invalidate(self.filename)
+
+    def _build_index(self, f):
+        """Return mapping from sentence id to (position, base offset)."""
+        index = OrderedDict()
+        lines = _PositionedLines(f)
+        start = 0
+        for sentence in conllu.read_conllu(lines, self.filename):
+            # read_conllu yields after consuming the separating
+            # empty line, so the position is at the next sentence.
+            index[sentence.id] = (start, sentence.base_offset)
+            start = lines.position
+        return index
+
+    def _read_lines(self, sid=None):
+        """Return lines of sentence with given id, or of the whole file
+        if sid is None.
+
+        The file is checked against the index after reading and
+        reindexed once if it has changed."""
+        for retry in (False, True):
+            if retry:
+                self.refresh()
+            if sid is None:
+                start = 0
+            elif sid in self._index:
+                start = self._index[sid][0]
+            else:
+                # removed on reindex
+                raise NotFoundError(sid)
+            lines = []
+            try:
+                with open(self.filename, 'rb') as f:
+                    f.seek(start)
+                    for line in f:
+                        lines.append(line)
+                        if sid is not None and not line.rstrip('\n'):
+                            break
+                    stamp = _stamp(os.fstat(f.fileno()))
+            except (IOError, OSError), e:
+                raise CorpusError('%s: %s' % (self.filename, e))
+            if stamp == self._stamp:
+                return [line.decode('utf-8') for line in lines]
+        raise CorpusError('%s: changed while reading' % self.filename)
+
+    def _read_sentence(self, sid):
+        lines = self._read_lines(sid)
+        # _read_lines may have reindexed
+        base_offset = self._index[sid][1]
+        sentence = next(conllu.read_conllu(lines, self.filename))
+        sentence.id = sid
+        sentence.assign_offsets(base_offset)
+        return sentence
+
+    def sentence(self, sid):
+        """Return Sentence with given id."""
+        if sid not in self._index:
+            raise NotFoundError(sid)
+        key = (self.filename, 'sentence', sid)
+        sentence = self.cache.get(key)
+        if sentence is None:
+            sentence = self._read_sentence(sid)
+            self.cache.put(key, sentence)
+        return sentence
+
+    def format_sentence(self, sid, format_):
+        """Return sentence with given id in given format."""
+        if sid not in self._index:
+            raise NotFoundError(sid)
+        key = (self.filename, 'sentence', sid, format_)
+        formatted = self.cache.get(key)
+        if formatted is None:
+            formatted = FORMATTERS[format_](self.sentence(sid))
+            self.cache.put(key, formatted)
+        return formatted
+
+    def format_document(self, did, format_):
+        """Return document with given id in given format.
+
+        As with conllu.read_documents(), each file is read as a single
+        document with id 1 containing all of its sentences."""
+        if did != 1:
+            raise NotFoundError(did)
+        key = (self.filename, 'document', did, format_)
+        formatted = self.cache.get(key)
+        if formatted is None:
+            formatted = u''.join(self.format_sentence(sid, format_)
+                                 for sid in self._index)
+            self.cache.put(key, formatted)
+        return formatted
+
+def format_conllu(sentence):
+    return unicode(sentence) + u'\n'
+
+def format_text(sentence):
+    return sentence.text() + u'\n'
+
+def format_brat(sentence):
+    return u''.join(l + u'\n' for l in sentence.to_brat_standoff_lines())
+
+FORMATTERS = {
+    'conllu': format_conllu,
+    'text': format_text,
+    'brat': format_brat,
+}
+
+class RequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Handler for GET requests of the forms
+
+        /corpora
+        /sentence/ID?corpus=FILE&format=FORMAT
+        /document/ID?corpus=FILE&format=FORMAT
+
+    where corpus is optional when serving a single file and format is
+    one of FORMATS (default DEFAULT_FORMAT)."""
+
+    def do_GET(self):
+        url = urlparse.urlparse(self.path)
+        query = urlparse.parse_qs(url.query)
+        parts = [p for p in url.path.split('/') if p]
+        corpora = self.server.corpora
+
+        if parts == ['corpora']:
+            return self.send_text(u''.join(u'%s\n' % c for c in corpora))
+        if len(parts) != 2 or parts[0] not in ('sentence', 'document'):
+            return self.send_error(404, 'Unknown path')
+        type_, id_ = parts
+
+        if 'corpus' in query:
+            name = query['corpus'][0]
+        elif len(corpora) == 1:
+            name = corpora.keys()[0]
+        else:
+            return self.send_error(400, 'Missing corpus')
+        if name not in corpora:
+            return self.send_error(404, 'Unknown corpus')
+
+        format_ = query.get('format', [DEFAULT_FORMAT])[0]
+        if format_ not in FORMATS:
+            return self.send_error(400, 'Unknown format')
+
+        try:
+            id_ = int(id_)
+        except ValueError:
+            return self.send_error(404, 'Invalid id')
+
+        corpus = corpora[name]
+        try:
+            corpus.refresh()
+        except CorpusError, e:
+            # serve from the last good index where possible
+            self.log_error('%s', e)
+        try:
+            if type_ == 'sentence':
+                text = corpus.format_sentence(id_, format_)
+            else:
+                text = corpus.format_document(id_, format_)
+        except NotFoundError:
+            return self.send_error(404, 'Unknown %s' % type_)
+        except CorpusError, e:
+            return self.send_error(503, str(e))
+        except Exception, e:
+            # invalid data, e.g. references to missing elements
+            self.log_error('%s: %r', name, e)
+            return self.send_error(500, 'Failed to format %s %d: %r' % (
+                type_, id_, e))
+        self.send_text(text)
+
+    def send_text(self, text):
+        data = text.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+def serve(filenames, options):
+    cache = LRUCache(options.cache_size)
+    try:
+        corpora = OrderedDict((fn, Corpus(fn, cache)) for fn in filenames)
+    except CorpusError, e:
+        print >> sys.stderr, 'Error: %s' % str(e)
+        return 1
+    server = BaseHTTPServer.HTTPServer((options.host, options.port),
+                                       RequestHandler)
+    server.corpora = corpora
+    print >> sys.stderr, 'Serving %d file(s) on http://%s:%d/' % (
+        len(corpora), options.host, options.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+def main(argv):
+    args = argparser().parse_args(argv[1:])
+    return serve(args.file, args)
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))